@@ -2,13 +2,11 @@ import streamlit as st
 import subprocess
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import json
 import os
+from dataclasses import dataclass, fields
 from typing import List, Dict, Tuple, Optional
 
 # Set page config with light theme
@@ -19,112 +17,252 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS to force light mode and improve styling
-st.markdown("""
-<style>
-    /* Force light mode */
-    .stApp {
-        background-color: white !important;
-        color: black !important;
-    }
-    
-    /* Force sidebar to light mode */
-    .css-1d391kg {
-        background-color: #f8f9fa !important;
-    }
+@st.cache_resource
+def _load_css() -> str:
+    """Read the stylesheet once per server process"""
+    with open(os.path.join("static", "app.css"), 'r') as f:
+        return f"<style>\n{f.read()}</style>"
+
+# Custom CSS to force light mode and improve styling. Streamlit drops elements
+# that a rerun does not emit again, so the cached stylesheet is re-sent each run.
+st.html(_load_css())
+
+
+class OptimizerError(Exception):
+    """Raised when the C++ optimizer exits or reports that no solution was found"""
+
+
+@dataclass(eq=False)
+class Centers:
+    """Optimal centers as parallel arrays, one entry per center"""
+    id: np.ndarray
+    lat: np.ndarray
+    lon: np.ndarray
+    land_type: np.ndarray
+    slope: np.ndarray
+    elevation: np.ndarray
     
-    /* Force main content area to light mode */
-    .main > div {
-        padding-top: 2rem;
-        background-color: white !important;
-        color: black !important;
-    }
+    @classmethod
+    def from_records(cls, records: List[Dict]) -> "Centers":
+        """Build from the optimizer's list of per-center JSON objects"""
+        return cls(
+            id=np.array([r['id'] for r in records], dtype=np.int32),
+            lat=np.array([r['lat'] for r in records], dtype=np.float64),
+            lon=np.array([r['lon'] for r in records], dtype=np.float64),
+            land_type=np.array([r['land_type'] for r in records], dtype=object),
+            slope=np.array([r['slope'] for r in records], dtype=np.float64),
+            elevation=np.array([r['elevation'] for r in records], dtype=np.float64)
+        )
     
-    /* Style metrics */
-    .stMetric {
-        background-color: #f8f9fa !important;
-        border: 1px solid #dee2e6 !important;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.5rem 0;
-        color: black !important;
-    }
+    def __len__(self) -> int:
+        return len(self.id)
     
-    /* Success box styling */
-    .success-box {
-        background-color: #d4edda !important;
-        border: 1px solid #c3e6cb !important;
-        border-radius: 0.5rem;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        color: #155724 !important;
-    }
+    def to_frame(self) -> pd.DataFrame:
+        """Tabular view for display"""
+        return pd.DataFrame({f.name: getattr(self, f.name) for f in fields(self)})
+
+
+def _get_input_fingerprint(data_files: Tuple[str, ...]) -> Tuple[int, ...]:
+    """Modification times of the optimizer binary and its input files"""
+    fingerprint = []
+    for path in ("./center_optimizer",) + tuple(data_files):
+        try:
+            fingerprint.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            fingerprint.append(0)
+    return tuple(fingerprint)
+
+
+# Explicit dtypes let the pyarrow reader skip type inference
+RESOURCE_DTYPES = {'id': 'int32', 'latitude': 'float32', 'longitude': 'float32', 'resource_quantity': 'int32'}
+ZONE_DTYPES = {
+    'id': 'int32',
+    'slope': 'float32',
+    'elevation': 'float32',
+    'land_type': pd.CategoricalDtype(['agricultural', 'urban', 'barren', 'forest', 'wetland', 'water', 'steep_terrain'])
+}
+
+
+@st.cache_data(show_spinner=False)
+def _read_datasets(resource_path: str, zone_path: str, road_path: str, fingerprint: Tuple[int, ...]):
+    """Read the three CSVs, cached until one of them changes on disk"""
+    resources = pd.read_csv(resource_path, engine='pyarrow', dtype_backend='pyarrow', dtype=RESOURCE_DTYPES)
+    zones = pd.read_csv(zone_path, engine='pyarrow', dtype_backend='pyarrow', dtype=ZONE_DTYPES)
+    roads = pd.read_csv(road_path, engine='pyarrow', dtype_backend='pyarrow')
     
-    /* Force text colors */
-    .stMarkdown, .stText, p, h1, h2, h3, h4, h5, h6 {
-        color: black !important;
-    }
+    # Plotly marker sizes, computed once instead of on every rerun
+    resources['_marker_size'] = resources['resource_quantity'].to_numpy(np.float32) * 0.05
     
-    /* Force dataframe styling */
-    .stDataFrame {
-        background-color: white !important;
-        color: black !important;
-    }
+    # Id-indexed view for positional lookups of assignment rows
+    resources_by_id = resources.set_index('id')[['latitude', 'longitude', 'resource_quantity']]
+    return resources, zones, roads, resources_by_id
+
+
+def _start_optimizer_server(data_files: Tuple[str, ...]) -> subprocess.Popen:
+    """Launch the optimizer in server mode so the datasets are loaded only once"""
+    return subprocess.Popen(
+        ["./center_optimizer", "--server", *data_files],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd="."
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _run_cpp_optimizer(data_files: Tuple[str, ...], k: int, min_distance: float,
+                       exclude_types: Tuple[str, ...], max_slope: float,
+                       fingerprint: Tuple[int, ...], _proc: subprocess.Popen):
+    """Send one request to the optimizer server, cached on its parameters and the input fingerprint"""
+    exclude_str = ",".join(exclude_types) if exclude_types else "none"
+    request = f"{k} {int(min_distance)} {int(max_slope)} {exclude_str}\n"
     
-    /* Force button styling */
-    .stButton > button {
-        background-color: #007bff !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 0.375rem;
-        padding: 0.5rem 1rem;
-    }
+    try:
+        _proc.stdin.write(request.encode())
+        _proc.stdin.flush()
+        
+        # Responses are a length line followed by a JSON document
+        header = _proc.stdout.readline()
+        if not header:
+            raise OptimizerError("optimizer server exited; rebuild the optimizer with ./setup.sh")
+        payload = json.loads(_proc.stdout.read(int(header)))
+    except BaseException:
+        # A half-read response would desynchronise every later request
+        _proc.kill()
+        raise
     
-    .stButton > button:hover {
-        background-color: #0056b3 !important;
-    }
+    # Raising keeps failed runs out of the cache
+    if 'error' in payload:
+        raise OptimizerError(payload['error'])
     
-    /* Force sidebar styling */
-    .stSidebar {
-        background-color: #f8f9fa !important;
-    }
+    return Centers.from_records(payload['centers']), payload['assignments'], payload['total_cost']
+
+
+def _apply_light_layout(fig, title: str, height: int = 400):
+    """Apply the shared light-mode styling to a dashboard figure"""
+    fig.update_layout(
+        height=height,
+        title_text=title,
+        showlegend=True,
+        template="plotly_white",  # Force light theme
+        paper_bgcolor="white",
+        plot_bgcolor="white",
+        font=dict(color="black"),
+        title_font=dict(color="black", size=16)
+    )
+    return fig
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: lambda df: pd.util.hash_pandas_object(df).sum()})
+def _build_optimization_plots(resources_df, centers, assignments):
+    """Build the results dashboard figures, cached per (resources, centers, assignments)
     
-    .stSidebar .stMarkdown, .stSidebar .stText, .stSidebar p, .stSidebar h1, .stSidebar h2, .stSidebar h3 {
-        color: black !important;
-    }
+    Returns (map, distribution pie, terrain, assignment bar); entries are None
+    when there is nothing to plot. Separate figures keep each payload small so
+    the browser can render them independently.
+    """
+    if not centers:
+        return None, None, None, None
     
-    /* Force input styling */
-    .stSlider, .stCheckbox, .stSelectbox {
-        color: black !important;
-    }
+    # Main map plot; WebGL keeps large point counts responsive
+    map_fig = go.Figure()
+    map_fig.add_trace(
+        go.Scattergl(
+            x=resources_df['longitude'],
+            y=resources_df['latitude'],
+            mode='markers',
+            marker=dict(
+                size=resources_df['_marker_size'],
+                color='lightblue',
+                opacity=0.6,
+                line=dict(width=1, color='darkblue')
+            ),
+            name='Resource Points',
+            text="ID: " + resources_df['id'].astype(str) + "<br>Quantity: " + resources_df['resource_quantity'].astype(str),
+            hovertemplate='%{text}<extra></extra>'
+        )
+    )
     
-    /* Ensure tabs are visible */
-    .stTabs [data-baseweb="tab-list"] {
-        background-color: #f8f9fa !important;
-    }
+    # Center locations
+    map_fig.add_trace(
+        go.Scattergl(
+            x=centers.lon,
+            y=centers.lat,
+            mode='markers+text',
+            marker=dict(
+                size=20,
+                color='red',
+                symbol='star',
+                line=dict(width=2, color='black')
+            ),
+            text=np.char.add("C", centers.id.astype(str)).tolist(),
+            textposition="top center",
+            name='Optimal Centers',
+            hovertemplate='Center ID: %{text}<br>Location: (%{x:.4f}, %{y:.4f})<extra></extra>'
+        )
+    )
+    _apply_light_layout(map_fig, 'Optimal Center Placement', height=500)
+    map_fig.update_xaxes(title_text="Longitude")
+    map_fig.update_yaxes(title_text="Latitude")
     
-    .stTabs [data-baseweb="tab"] {
-        color: black !important;
-        background-color: white !important;
-    }
+    # Resource distribution pie chart
+    pie_fig = None
+    bar_fig = None
+    if assignments:
+        assignment_df = pd.DataFrame(assignments)
+        # Shared by the pie and bar traces
+        center_counts = assignment_df['center_id'].value_counts()
+        pie_fig = go.Figure(
+            go.Pie(
+                labels=("Center " + center_counts.index.astype(str)).tolist(),
+                values=center_counts.values,
+                name="Resource Distribution"
+            )
+        )
+        _apply_light_layout(pie_fig, 'Resource Distribution by Center', height=500)
+        
+        # Assignment statistics
+        stats_data = center_counts.sort_index()
+        bar_fig = go.Figure(
+            go.Bar(
+                x=("Center " + stats_data.index.astype(str)).tolist(),
+                y=stats_data.values,
+                name='Points per Center',
+                marker_color='green'
+            )
+        )
+        _apply_light_layout(bar_fig, 'Assignment Statistics')
+        bar_fig.update_xaxes(title_text="Centers")
+        bar_fig.update_yaxes(title_text="Number of Points")
     
-    /* Force expander styling */
-    .streamlit-expanderHeader {
-        background-color: #f8f9fa !important;
-        color: black !important;
-    }
+    # Terrain analysis (slope vs elevation)
+    terrain_fig = None
+    if 'slope' in resources_df.columns and 'elevation' in resources_df.columns:
+        terrain_fig = go.Figure(
+            go.Scattergl(
+                x=resources_df['slope'],
+                y=resources_df['elevation'],
+                mode='markers',
+                marker=dict(
+                    size=8,
+                    color=resources_df['resource_quantity'],
+                    colorscale='Viridis',
+                    showscale=True,
+                    colorbar=dict(title="Resource Quantity")
+                ),
+                name='Terrain Points',
+                hovertemplate='Slope: %{x}°<br>Elevation: %{y}m<extra></extra>'
+            )
+        )
+        _apply_light_layout(terrain_fig, 'Terrain Analysis')
+        terrain_fig.update_xaxes(title_text="Slope (degrees)")
+        terrain_fig.update_yaxes(title_text="Elevation (meters)")
     
-    /* Chart container styling */
-    .stPlotlyChart {
-        background-color: white !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+    return map_fig, pie_fig, terrain_fig, bar_fig
+
 
 class OptimizationApp:
     def __init__(self):
         self.data_dir = "data"
         self.results_dir = "results"
+        self.resources_by_id = None
         self.ensure_directories()
         
     def ensure_directories(self):
@@ -132,226 +270,73 @@ class OptimizationApp:
         for dir_path in [self.data_dir, self.results_dir]:
             os.makedirs(dir_path, exist_ok=True)
     
+    def resolve_data_files(self) -> Tuple[str, str, str]:
+        """Locate the three input CSVs with a single directory scan per layout"""
+        layouts = [
+            (self.data_dir, ("resource_points.csv", "zone_features.csv", "road_network.csv")),
+            # Fallback to old names in the project root
+            (".", ("resource_points (1).csv", "zone_features.csv", "road_network.csv"))
+        ]
+        
+        for directory, names in layouts:
+            with os.scandir(directory) as entries:
+                present = {entry.name for entry in entries}
+            if names[0] in present:
+                missing = [name for name in names if name not in present]
+                if missing:
+                    raise FileNotFoundError(f"Missing in {directory}/: {', '.join(missing)}")
+                return tuple(os.path.join(directory, name) for name in names)
+        
+        raise FileNotFoundError(f"No resource points file found in {self.data_dir}/ or the project root")
+    
     def load_data(self):
         """Load all required datasets"""
         try:
-            resource_path = os.path.join(self.data_dir, "resource_points.csv")
-            zone_path = os.path.join(self.data_dir, "zone_features.csv")
-            road_path = os.path.join(self.data_dir, "road_network.csv")
-            
-            if os.path.exists(resource_path):
-                resources = pd.read_csv(resource_path)
-            else:
-                # Fallback to old name
-                resources = pd.read_csv("resource_points (1).csv")
-                
-            zones = pd.read_csv(zone_path)
-            roads = pd.read_csv(road_path)
+            data_files = self.resolve_data_files()
+            resources, zones, roads, self.resources_by_id = _read_datasets(
+                *data_files, _get_input_fingerprint(data_files)
+            )
             
             return resources, zones, roads
         except Exception as e:
             st.error(f"Error loading data: {str(e)}")
             return None, None, None
     
+    def get_optimizer_process(self, data_files: Tuple[str, ...], fingerprint: Tuple[int, ...]) -> subprocess.Popen:
+        """Return this session's optimizer server, restarting it if it died or its inputs changed"""
+        proc = st.session_state.get('optimizer_proc')
+        if proc is not None and proc.poll() is None and \
+                st.session_state.get('optimizer_fingerprint') == fingerprint:
+            return proc
+        
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+        
+        proc = _start_optimizer_server(data_files)
+        st.session_state.optimizer_proc = proc
+        st.session_state.optimizer_fingerprint = fingerprint
+        return proc
+    
     def run_cpp_optimizer(self, k: int, min_distance: float, exclude_types: List[str], max_slope: float):
         """Run the C++ optimizer with specified parameters"""
         try:
-            # Build command
-            exclude_str = ",".join(exclude_types) if exclude_types else "none"
-            cmd = [
-                "./center_optimizer",
-                os.path.join(self.data_dir, "resource_points.csv"),
-                os.path.join(self.data_dir, "zone_features.csv"), 
-                os.path.join(self.data_dir, "road_network.csv"),
-                str(k),
-                str(int(min_distance)),
-                exclude_str,
-                str(int(max_slope))
-            ]
-            
-            # Fallback to old filename if new one doesn't exist
-            if not os.path.exists(os.path.join(self.data_dir, "resource_points.csv")):
-                cmd[1] = "resource_points (1).csv"
-                cmd[2] = "zone_features.csv"
-                cmd[3] = "road_network.csv"
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=".")
-            
-            if result.returncode != 0:
-                st.error(f"Optimizer failed: {result.stderr}")
-                return None, None, None
-                
-            return self.parse_cpp_output(result.stdout)
+            data_files = self.resolve_data_files()
+            fingerprint = _get_input_fingerprint(data_files)
+            return _run_cpp_optimizer(
+                data_files, k, min_distance, tuple(sorted(exclude_types)), max_slope,
+                fingerprint, self.get_optimizer_process(data_files, fingerprint)
+            )
             
+        except OptimizerError as e:
+            st.error(f"Optimizer failed: {str(e)}")
+            return None, None, None
         except Exception as e:
             st.error(f"Error running optimizer: {str(e)}")
             return None, None, None
     
-    def parse_cpp_output(self, output: str):
-        """Parse C++ optimizer output"""
-        lines = output.strip().split('\n')
-        centers = []
-        assignments = []
-        total_cost = 0
-        
-        reading_centers = False
-        reading_assignments = False
-        
-        for line in lines:
-            if line.startswith('Best Centers'):
-                reading_centers = True
-                reading_assignments = False
-                continue
-            elif line.startswith('Assignments'):
-                reading_centers = False
-                reading_assignments = True
-                continue
-            elif line.startswith('Total Cost:'):
-                total_cost = float(line.split(':')[1].strip())
-                break
-                
-            if reading_centers and line.strip():
-                parts = line.split(',')
-                if len(parts) >= 6:
-                    centers.append({
-                        'id': int(parts[0]),
-                        'lat': float(parts[1]),
-                        'lon': float(parts[2]),
-                        'land_type': parts[3],
-                        'slope': float(parts[4]),
-                        'elevation': float(parts[5])
-                    })
-            elif reading_assignments and line.strip():
-                parts = line.split(' -> ')
-                if len(parts) == 2:
-                    resource_id = int(parts[0].split(':')[1].strip())
-                    center_id = int(parts[1].split(':')[1].strip())
-                    assignments.append({'resource_id': resource_id, 'center_id': center_id})
-        
-        return centers, assignments, total_cost
-    
-    def create_optimization_plot(self, resources_df, centers, assignments):
-        """Create an interactive plot of optimization results"""
-        if not centers:
-            return None
-            
-        # Create subplot
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=('Optimal Center Placement', 'Resource Distribution by Center', 
-                          'Terrain Analysis', 'Assignment Statistics'),
-            specs=[[{"secondary_y": False}, {"type": "pie"}],
-                   [{"secondary_y": False}, {"type": "bar"}]]
-        )
-        
-        # Main map plot
-        fig.add_trace(
-            go.Scatter(
-                x=resources_df['longitude'],
-                y=resources_df['latitude'],
-                mode='markers',
-                marker=dict(
-                    size=resources_df['resource_quantity']/20,
-                    color='lightblue',
-                    opacity=0.6,
-                    line=dict(width=1, color='darkblue')
-                ),
-                name='Resource Points',
-                text=resources_df.apply(lambda x: f"ID: {x['id']}<br>Quantity: {x['resource_quantity']}", axis=1),
-                hovertemplate='%{text}<extra></extra>'
-            ),
-            row=1, col=1
-        )
-        
-        # Center locations
-        center_df = pd.DataFrame(centers)
-        if not center_df.empty:
-            fig.add_trace(
-                go.Scatter(
-                    x=center_df['lon'],
-                    y=center_df['lat'],
-                    mode='markers+text',
-                    marker=dict(
-                        size=20,
-                        color='red',
-                        symbol='star',
-                        line=dict(width=2, color='black')
-                    ),
-                    text=[f"C{c['id']}" for c in centers],
-                    textposition="top center",
-                    name='Optimal Centers',
-                    hovertemplate='Center ID: %{text}<br>Location: (%{x:.4f}, %{y:.4f})<extra></extra>'
-                ),
-                row=1, col=1
-            )
-        
-        # Resource distribution pie chart
-        if assignments:
-            assignment_df = pd.DataFrame(assignments)
-            center_counts = assignment_df['center_id'].value_counts()
-            fig.add_trace(
-                go.Pie(
-                    labels=[f"Center {cid}" for cid in center_counts.index],
-                    values=center_counts.values,
-                    name="Resource Distribution"
-                ),
-                row=1, col=2
-            )
-        
-        # Terrain analysis (slope vs elevation)
-        if 'slope' in resources_df.columns and 'elevation' in resources_df.columns:
-            fig.add_trace(
-                go.Scatter(
-                    x=resources_df['slope'],
-                    y=resources_df['elevation'],
-                    mode='markers',
-                    marker=dict(
-                        size=8,
-                        color=resources_df['resource_quantity'],
-                        colorscale='Viridis',
-                        showscale=True,
-                        colorbar=dict(title="Resource Quantity")
-                    ),
-                    name='Terrain Points',
-                    hovertemplate='Slope: %{x}°<br>Elevation: %{y}m<extra></extra>'
-                ),
-                row=2, col=1
-            )
-        
-        # Assignment statistics
-        if assignments:
-            stats_data = assignment_df['center_id'].value_counts().sort_index()
-            fig.add_trace(
-                go.Bar(
-                    x=[f"Center {cid}" for cid in stats_data.index],
-                    y=stats_data.values,
-                    name='Points per Center',
-                    marker_color='green'
-                ),
-                row=2, col=2
-            )
-        
-        # Update layout for light mode
-        fig.update_layout(
-            height=800,
-            title_text="Optimization Results Dashboard",
-            showlegend=True,
-            template="plotly_white",  # Force light theme
-            paper_bgcolor="white",
-            plot_bgcolor="white",
-            font=dict(color="black"),
-            title_font=dict(color="black", size=16)
-        )
-        
-        # Update axes labels
-        fig.update_xaxes(title_text="Longitude", row=1, col=1)
-        fig.update_yaxes(title_text="Latitude", row=1, col=1)
-        fig.update_xaxes(title_text="Slope (degrees)", row=2, col=1)
-        fig.update_yaxes(title_text="Elevation (meters)", row=2, col=1)
-        fig.update_xaxes(title_text="Centers", row=2, col=2)
-        fig.update_yaxes(title_text="Number of Points", row=2, col=2)
-        
-        return fig
+    def create_optimization_plots(self, resources_df, centers, assignments):
+        """Create interactive plots of optimization results"""
+        return _build_optimization_plots(resources_df, centers, assignments)
 
 def main():
     app = OptimizationApp()
@@ -400,16 +385,36 @@ def main():
     
     
     # Optimization results
-    if run_optimization:
+    # Results persist in session_state so tab switches and other reruns
+    # redisplay the last run instead of requiring another click
+    if run_optimization or 'last_result' in st.session_state:
         st.header("Optimization Results")
         
-        with st.spinner("Running optimization algorithm..."):
-            centers, assignments, total_cost = app.run_cpp_optimizer(
-                k=k,
-                min_distance=min_distance,
-                exclude_types=exclude_types,
-                max_slope=max_slope
-            )
+        # Loaded once and shared by the visualization and detailed results tabs
+        resources_df, zones_df, roads_df = app.load_data()
+        
+        if resources_df is None or zones_df is None or roads_df is None:
+            st.error("Failed to load required data files. Please check the data directory.")
+            return
+        
+        params = (k, min_distance, tuple(exclude_types), max_slope)
+        if run_optimization:
+            with st.spinner("Running optimization algorithm..."):
+                centers, assignments, total_cost = app.run_cpp_optimizer(
+                    k=k,
+                    min_distance=min_distance,
+                    exclude_types=exclude_types,
+                    max_slope=max_slope
+                )
+            
+            if centers:
+                st.session_state.last_result = (centers, assignments, total_cost) + params
+            else:
+                st.session_state.pop('last_result', None)
+        else:
+            centers, assignments, total_cost = st.session_state.last_result[:3]
+            if st.session_state.last_result[3:] != params:
+                st.info("Parameters have changed since these results were computed. Click Run Optimization to update.")
         
         if centers:
             # Success message
@@ -427,45 +432,44 @@ def main():
             
             with tab1:
                 st.subheader("Optimal Center Locations")
-                centers_df = pd.DataFrame(centers)
-                st.dataframe(centers_df, use_container_width=True)
+                st.dataframe(centers.to_frame(), use_container_width=True)
                 
                 # Summary metrics
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    avg_slope = centers_df['slope'].mean()
+                    avg_slope = centers.slope.mean()
                     st.metric("Average Slope", f"{avg_slope:.1f}°")
                 with col2:
-                    avg_elevation = centers_df['elevation'].mean()
+                    avg_elevation = centers.elevation.mean()
                     st.metric("Average Elevation", f"{avg_elevation:.1f}m")
                 with col3:
-                    land_types = centers_df['land_type'].unique()
+                    land_types = set(centers.land_type)
                     st.metric("Land Types Used", len(land_types))
             
             with tab2:
                 st.subheader("Interactive Visualization")
                 
-                # Ensure resources_df is loaded before use
-                resources_df, zones_df, roads_df = app.load_data()
-
-                if resources_df is None or zones_df is None or roads_df is None:
-                    st.error("Failed to load required data files. Please check the data directory.")
-                    return
-
-                fig = app.create_optimization_plot(resources_df, centers, assignments)
-                if fig:
-                    st.plotly_chart(fig, use_container_width=True)
+                map_fig, pie_fig, terrain_fig, bar_fig = app.create_optimization_plots(
+                    resources_df, centers, assignments
+                )
+                
+                col1, col2 = st.columns(2)
+                for col, figs in ((col1, (map_fig, terrain_fig)), (col2, (pie_fig, bar_fig))):
+                    with col:
+                        for fig in figs:
+                            if fig:
+                                st.plotly_chart(fig, use_container_width=True)
             
             with tab3:
                 st.subheader("Detailed Assignment Results")
                 if assignments:
                     assignments_df = pd.DataFrame(assignments)
                     
-                    # Merge with resource data for detailed view
-                    detailed_assignments = assignments_df.merge(
-                        resources_df[['id', 'latitude', 'longitude', 'resource_quantity']], 
-                        left_on='resource_id', right_on='id', how='left'
-                    )
+                    # Look up resource data by id for detailed view
+                    resource_ids = assignments_df['resource_id'].to_numpy(np.int32)
+                    detailed_assignments = app.resources_by_id.reindex(resource_ids) \
+                        .rename_axis('resource_id').reset_index()
+                    detailed_assignments.insert(1, 'center_id', pd.Categorical(assignments_df['center_id']))
                     
                     st.dataframe(detailed_assignments, use_container_width=True)
                     
@@ -11,6 +11,7 @@
 #include <limits>
 #include <random>
 #include <chrono>
+#include <iomanip>
 
 struct Point
 {
@@ -44,6 +45,14 @@ public:
         rng.seed(std::chrono::steady_clock::now().time_since_epoch().count());
     }
 
+    void configure(int k_val, double min_dist, const std::set<std::string> &exclude_types, double max_slope_val)
+    {
+        k = k_val;
+        min_distance_km = min_dist;
+        exclude_land_types = exclude_types;
+        max_slope = max_slope_val;
+    }
+
     void load_points(const std::string &filename)
     {
         std::ifstream file(filename);
@@ -417,26 +426,53 @@ public:
 
         std::cout << "\nTotal Cost: " << total_cost << std::endl;
     }
-};
 
-int main(int argc, char *argv[])
-{
-    if (argc < 5)
+    static std::string json_escape(const std::string &value)
     {
-        std::cerr << "Usage: " << argv[0] << " <resource_points.csv> <zone_features.csv> <road_network.csv> <k> [min_distance_km] [exclude_land_types] [max_slope]" << std::endl;
-        return 1;
+        std::string escaped;
+        for (char c : value)
+        {
+            if (c == '"' || c == '\\')
+                escaped += '\\';
+            if (static_cast<unsigned char>(c) >= 0x20)
+                escaped += c;
+        }
+        return escaped;
     }
 
-    std::string resource_file = argv[1];
-    std::string zone_file = argv[2];
-    std::string road_file = argv[3];
-    int k = std::stoi(argv[4]);
+    void write_results_json(const std::vector<int> &medoids, double total_cost, std::ostream &out)
+    {
+        out << std::setprecision(15);
+        out << "{\"centers\":[";
+        for (int i = 0; i < medoids.size(); i++)
+        {
+            const Point &p = points[medoids[i]];
+            if (i > 0)
+                out << ",";
+            out << "{\"id\":" << p.id << ",\"lat\":" << p.lat << ",\"lon\":" << p.lon
+                << ",\"land_type\":\"" << json_escape(p.land_type) << "\",\"slope\":" << p.slope
+                << ",\"elevation\":" << p.elevation << "}";
+        }
 
-    double min_distance_km = (argc > 5) ? std::stod(argv[5]) : 2.0;
+        out << "],\"assignments\":[";
+        std::vector<int> assignments = get_assignments(medoids);
+        for (int i = 0; i < points.size(); i++)
+        {
+            if (i > 0)
+                out << ",";
+            out << "{\"resource_id\":" << points[i].id << ",\"center_id\":"
+                << points[medoids[assignments[i]]].id << "}";
+        }
+
+        out << "],\"total_cost\":" << total_cost << "}";
+    }
+};
+
+std::set<std::string> parse_exclude_types(const std::string &exclude_str)
+{
     std::set<std::string> exclude_types;
-    if (argc > 6 && std::string(argv[6]) != "none")
+    if (exclude_str != "none")
     {
-        std::string exclude_str = argv[6];
         std::istringstream ss(exclude_str);
         std::string token;
         while (std::getline(ss, token, ','))
@@ -444,7 +480,91 @@ int main(int argc, char *argv[])
             exclude_types.insert(token);
         }
     }
-    double max_slope = (argc > 7) ? std::stod(argv[7]) : 30.0;
+    return exclude_types;
+}
+
+// Keep the datasets loaded and answer one request per stdin line:
+//   <k> <min_distance_km> <max_slope> <exclude_land_types|none>
+// Each response is a length line followed by that many bytes of JSON.
+int run_server(const std::string &resource_file, const std::string &zone_file, const std::string &road_file)
+{
+    // Progress messages go to stderr so stdout only carries responses
+    std::ostream protocol(std::cout.rdbuf());
+    std::cout.rdbuf(std::cerr.rdbuf());
+
+    KMedoidsOptimizer optimizer(1, 0.0, {}, 90.0);
+    optimizer.load_points(resource_file);
+    optimizer.load_zone_features(zone_file);
+    optimizer.load_distances(road_file);
+
+    std::string line;
+    while (std::getline(std::cin, line))
+    {
+        std::istringstream ss(line);
+        int k;
+        double min_distance_km, max_slope;
+        std::string exclude_str = "none";
+        std::ostringstream response;
+
+        if (!(ss >> k >> min_distance_km >> max_slope))
+        {
+            response << "{\"error\":\"Malformed request\"}";
+        }
+        else
+        {
+            ss >> exclude_str;
+            optimizer.configure(k, min_distance_km, parse_exclude_types(exclude_str), max_slope);
+
+            auto [medoids, cost] = optimizer.optimize();
+            if (!medoids.empty())
+                optimizer.write_results_json(medoids, cost, response);
+            else
+                response << "{\"error\":\"No valid solution found\"}";
+        }
+
+        std::string body = response.str();
+        protocol << body.size() << "\n"
+                 << body << std::flush;
+    }
+
+    return 0;
+}
+
+int main(int argc, char *argv[])
+{
+    if (argc == 5 && std::string(argv[1]) == "--server")
+    {
+        return run_server(argv[2], argv[3], argv[4]);
+    }
+
+    // Split "--output-json=<path>" off from the positional arguments
+    const std::string json_flag = "--output-json=";
+    std::string json_file;
+    std::vector<std::string> args;
+    for (int i = 0; i < argc; i++)
+    {
+        std::string arg = argv[i];
+        if (arg.rfind(json_flag, 0) == 0)
+            json_file = arg.substr(json_flag.size());
+        else
+            args.push_back(arg);
+    }
+
+    if (args.size() < 5)
+    {
+        std::cerr << "Usage: " << args[0] << " <resource_points.csv> <zone_features.csv> <road_network.csv> <k> [min_distance_km] [exclude_land_types] [max_slope] [--output-json=<path>]" << std::endl;
+        std::cerr << "       " << args[0] << " --server <resource_points.csv> <zone_features.csv> <road_network.csv>" << std::endl;
+        return 1;
+    }
+
+    std::string resource_file = args[1];
+    std::string zone_file = args[2];
+    std::string road_file = args[3];
+    int k = std::stoi(args[4]);
+
+    double min_distance_km = (args.size() > 5) ? std::stod(args[5]) : 2.0;
+    std::set<std::string> exclude_types = (args.size() > 6) ? parse_exclude_types(args[6]) : std::set<std::string>();
+    double max_slope = (args.size() > 7) ? std::stod(args[7]) : 30.0;
 
     KMedoidsOptimizer optimizer(k, min_distance_km, exclude_types, max_slope);
 
@@ -457,6 +577,17 @@ int main(int argc, char *argv[])
     if (!medoids.empty())
     {
         optimizer.print_results(medoids, cost);
+
+        if (!json_file.empty())
+        {
+            std::ofstream out(json_file);
+            if (!out.is_open())
+            {
+                std::cerr << "Error: Cannot write " << json_file << std::endl;
+                return 1;
+            }
+            optimizer.write_results_json(medoids, cost, out);
+        }
     }
     else
     {
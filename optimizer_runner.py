@@ -0,0 +1,82 @@
+"""
+Shared driver for running the C++ optimizer from the helper scripts.
+Successful runs are cached on disk, keyed by the arguments and the
+modification times of the binary and input files, so repeating a
+validation or visualization run with unchanged inputs skips the optimizer.
+Set ORC_NO_CACHE=1 (e.g. in CI) to always run the optimizer.
+"""
+
+import functools
+import hashlib
+import os
+import subprocess
+from typing import List, Optional, Tuple
+
+OPTIMIZER = './center_optimizer'
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'orc_validator')
+MAX_CACHE_ENTRIES = 32
+CACHE_ENABLED = os.environ.get('ORC_NO_CACHE', '').lower() in ('', '0', 'false')
+
+@functools.lru_cache(maxsize=None)
+def input_files() -> Tuple[str, str, str]:
+    """Resource, zone and road CSVs, preferring the data/ layout (resolved once per process)"""
+    try:
+        data_files = set(os.listdir('data'))
+    except OSError:
+        data_files = set()
+    if 'resource_points.csv' in data_files:
+        return 'data/resource_points.csv', 'data/zone_features.csv', 'data/road_network.csv'
+    return 'resource_points (1).csv', 'zone_features.csv', 'road_network.csv'
+
+def _cache_key(cmd: List[str]) -> str:
+    """Hash of the command line and the mtimes of every file it depends on"""
+    mtimes = []
+    for path in [OPTIMIZER, *cmd[1:4]]:
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(0)
+    return hashlib.sha1(repr((cmd, mtimes)).encode()).hexdigest()
+
+def _load_cache(key: str) -> Optional[bytes]:
+    try:
+        with open(os.path.join(CACHE_DIR, f"{key}.out"), 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def _store_cache(key: str, stdout: bytes):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = os.path.join(CACHE_DIR, f"{key}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(stdout)
+        os.replace(tmp_path, os.path.join(CACHE_DIR, f"{key}.out"))
+
+        # Keep only the most recent entries
+        entries = sorted((e for e in os.scandir(CACHE_DIR) if e.name.endswith('.out')),
+                         key=lambda e: e.stat().st_mtime_ns)
+        for entry in entries[:-MAX_CACHE_ENTRIES]:
+            os.remove(entry.path)
+    except OSError:
+        pass  # Caching is best-effort
+
+def run_optimizer(k: int, min_distance: float, exclude_types: str, max_slope: float,
+                  timeout: Optional[float] = None, use_cache: bool = True) -> subprocess.CompletedProcess:
+    """
+    Run the optimizer (or replay a cached run) and return its completed process.
+    stdout and stderr are left as bytes; callers decode only what they use.
+    With use_cache=False the binary always runs; a successful run still
+    refreshes the cache for later callers.
+    """
+    cmd = [OPTIMIZER, *input_files(), str(k), str(min_distance), exclude_types, str(max_slope)]
+    key = _cache_key(cmd)
+
+    cached = _load_cache(key) if CACHE_ENABLED and use_cache else None
+    if cached is not None:
+        return subprocess.CompletedProcess(cmd, 0, cached, b'')
+
+    result = subprocess.run(cmd, capture_output=True, timeout=timeout)
+    if result.returncode == 0 and CACHE_ENABLED:
+        _store_cache(key, result.stdout)
+    return result
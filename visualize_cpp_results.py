@@ -1,87 +1,74 @@
-import subprocess
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Render straight to file; no GUI backend to initialise
 import matplotlib.pyplot as plt
-import json
-import os
+from optimizer_runner import input_files, run_optimizer
+
+# Only these resource columns are plotted
+PLOT_COLUMNS = ['id', 'latitude', 'longitude', 'resource_quantity']
 
 # Run the C++ optimizer and parse output
 def run_cpp():
-    # Try new data structure first, fallback to old
-    if os.path.exists('data/resource_points.csv'):
-        resource_file = 'data/resource_points.csv'
-        zone_file = 'data/zone_features.csv'
-        road_file = 'data/road_network.csv'
-    else:
-        resource_file = 'resource_points (1).csv'
-        zone_file = 'zone_features.csv'
-        road_file = 'road_network.csv'
-    
-    cmd = ['./center_optimizer', resource_file, zone_file, road_file, '3', '2', 'wetland', '25']
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = run_optimizer(3, 2, 'wetland', 25)
     if result.returncode != 0:
-        print(result.stderr)
+        print(result.stderr.decode('utf-8', 'replace'))
         return None, None
-    lines = result.stdout.strip().split('\n')
+    # Single pass: find the centers block, then stop at the total cost
     centers = []
-    reading = False
-    for line in lines:
-        if line.startswith('Best Centers'):
-            reading = True
+    total_cost = None
+    state = 'pre'
+    for line in result.stdout.splitlines():
+        if state == 'pre':
+            if line.startswith(b'Best Centers'):
+                state = 'centers'
             continue
-        if line.startswith('Assignments:') or line.startswith('Total Cost:'):
-            if line.startswith('Total Cost:'):
-                total_cost = float(line.split(':')[1].strip())
+        if line.startswith(b'Total Cost:'):
+            total_cost = float(line.partition(b':')[2])
             break
-        if reading and line.strip():
-            parts = line.split(',')
+        if line.startswith(b'Assignments:'):
+            state = 'done'
+            continue
+        if state == 'centers' and line:
+            parts = line.split(b',', 5)
             if len(parts) >= 6:  # Ensure we have all required parts
                 centers.append({
                     'id': int(parts[0]),
                     'lat': float(parts[1]),
                     'lon': float(parts[2]),
-                    'land_type': parts[3],
+                    'land_type': parts[3].decode(),
                     'slope': float(parts[4]),
                     'elevation': float(parts[5])
                 })
     
-    # Find total cost if not found yet
-    if 'total_cost' not in locals():
-        for line in lines:
-            if line.startswith('Total Cost:'):
-                total_cost = float(line.split(':')[1].strip())
-                break
-    
     return centers, total_cost
 
 def main():
-    # Load data - try new structure first
-    if os.path.exists('data/resource_points.csv'):
-        resource_df = pd.read_csv('data/resource_points.csv')
-        zone_df = pd.read_csv('data/zone_features.csv')
-    else:
-        resource_df = pd.read_csv('resource_points (1).csv')
-        zone_df = pd.read_csv('zone_features.csv')
+    # Load the same resource file the optimizer is run on
+    resource_file = input_files()[0]
+    resource_df = pd.read_csv(resource_file, engine='pyarrow', dtype_backend='pyarrow', usecols=PLOT_COLUMNS)
     centers, total_cost = run_cpp()
     if not centers:
         print('No centers found.')
         return
-    center_ids = [c['id'] for c in centers]
-    center_df = resource_df[resource_df['id'].isin(center_ids)]
+    # Centers already carry their coordinates, so no lookup into resource_df
+    cx = np.fromiter((c['lon'] for c in centers), float, count=len(centers))
+    cy = np.fromiter((c['lat'] for c in centers), float, count=len(centers))
+    cid = [c['id'] for c in centers]
 
     # Plot
-    plt.figure(figsize=(10, 8))
-    plt.scatter(resource_df['longitude'], resource_df['latitude'], s=resource_df['resource_quantity']/5, c='lightblue', label='Resource Points', alpha=0.6)
-    plt.scatter(center_df['longitude'], center_df['latitude'], s=200, c='red', marker='*', label='Optimal Centers', edgecolors='black')
-    for _, row in center_df.iterrows():
-        plt.annotate(f"Center {row['id']}", (row['longitude'], row['latitude']), xytext=(5, 5), textcoords='offset points')
+    plt.figure(figsize=(10, 8), constrained_layout=True)
+    plt.scatter(resource_df['longitude'], resource_df['latitude'], s=resource_df['resource_quantity']/5, c='lightblue', label='Resource Points', alpha=0.6, rasterized=True)
+    plt.scatter(cx, cy, s=200, c='red', marker='*', label='Optimal Centers', edgecolors='black')
+    for x, y, i in zip(cx, cy, cid):
+        plt.annotate(f"Center {i}", (x, y), xytext=(5, 5), textcoords='offset points')
     plt.xlabel('Longitude')
     plt.ylabel('Latitude')
     plt.title(f'Optimal Collection Centers (Total Cost: {total_cost:.0f})')
     plt.legend()
     plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('cpp_optimal_centers.png', dpi=200)
-    plt.show()
+    plt.savefig('cpp_optimal_centers.png', dpi=120, pil_kwargs={'optimize': True})
+    print('Saved plot to cpp_optimal_centers.png')
 
 if __name__ == '__main__':
     main()